@@ -28,6 +28,9 @@ class CenterPreferringPlayer(Player):
     Falls back to random moves if center area is full.
     """
 
+    # This player only reads the board, so a read-only view is enough
+    needs_board_copy = False
+
     def get_move(self, board: np.ndarray, valid_moves: list) -> Tuple[int, int]:
         """
         Choose a move, preferring positions near the center.
@@ -45,22 +48,15 @@ class CenterPreferringPlayer(Player):
         board_size = board.shape[0]
         center = board_size // 2
 
-        # Score each move based on distance to center
-        best_move = None
-        best_score = float('inf')
-
-        for row, col in valid_moves:
-            # Calculate Manhattan distance to center
-            distance = abs(row - center) + abs(col - center)
+        # Score every empty cell at once by Manhattan distance to center
+        moves = np.argwhere(board == 0)
+        distance = np.abs(moves[:, 0] - center) + np.abs(moves[:, 1] - center)
 
-            # Add some randomness to avoid always picking the same pattern
-            score = distance + np.random.random() * 0.5
+        # Add some randomness to avoid always picking the same pattern
+        score = distance + np.random.random(len(moves)) * 0.5
 
-            if score < best_score:
-                best_score = score
-                best_move = (row, col)
-
-        return best_move
+        row, col = moves[np.argmin(score)]
+        return int(row), int(col)
 
     def game_over(self, winner: int):
         """
@@ -76,6 +72,8 @@ class CornerPreferringPlayer(Player):
     Another example AI that prefers corners, then edges, then center.
     """
 
+    needs_board_copy = False  # Doesn't look at the board at all
+
     def get_move(self, board: np.ndarray, valid_moves: list) -> Tuple[int, int]:
         """Choose a move, preferring corners."""
         if not valid_moves:
@@ -83,24 +81,19 @@ class CornerPreferringPlayer(Player):
 
         board_size = board.shape[0]
         max_idx = board_size - 1
+        valid_move_set = set(valid_moves)
 
         # Check for corners
         corners = [(0, 0), (0, max_idx), (max_idx, 0), (max_idx, max_idx)]
         for corner in corners:
-            if corner in valid_moves:
+            if corner in valid_move_set:
                 return corner
 
-        # Check for edges (not corners)
-        edges = []
-        for i in range(board_size):
-            edges.append((0, i))
-            edges.append((max_idx, i))
-            edges.append((i, 0))
-            edges.append((i, max_idx))
-
-        for edge in edges:
-            if edge in valid_moves and edge not in corners:
-                return edge
+        # Check for edges (corners are all taken by now, so skip them)
+        for i in range(1, max_idx):
+            for edge in ((0, i), (max_idx, i), (i, 0), (i, max_idx)):
+                if edge in valid_move_set:
+                    return edge
 
         # Fall back to first available move
         return valid_moves[0]
@@ -1,8 +1,40 @@
 import numpy as np
+import operator
 import os
+import sys
+from functools import lru_cache
 
 def clear():
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clear the terminal with an ANSI escape (set TICTACTOE_LEGACY_CLEAR=1 to shell out instead)."""
+    if os.environ.get("TICTACTOE_LEGACY_CLEAR"):
+        os.system("cls" if os.name == "nt" else "clear")
+        return
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
+
+def resolve_win_length(size: int, win_length: int = None) -> int:
+    """
+    Return the win length for a size x size board.
+    Args:
+        size: Board size
+        win_length: Requested win length, or None for the default (size up to 5x5, 5 beyond)
+    Returns:
+        Number in a row needed to win
+    """
+    return win_length or (size if size <= 5 else 5)
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size: int) -> list:
+    """
+    Return the Zobrist keys for a size x size board, generated once per size and shared.
+    Args:
+        size: Board size
+    Returns:
+        Keys indexed [row][col][0 for player -1, 1 for player 1], as nested lists of Python
+        ints so the per-move XOR doesn't box a numpy scalar. Callers must not modify them.
+    """
+    return np.random.default_rng(0x5eed).integers(
+        0, 2**63 - 1, size=(size, size, 2), dtype=np.uint64).tolist()
 
 class TicTacToeGame:
     """
@@ -11,6 +43,9 @@ class TicTacToeGame:
     -1: Player 1
      0: Empty
      1: Player 2
+
+    Alongside the board array, each player's stones are tracked as a bitboard:
+    a Python int where bit (row * size + col) is set for every occupied cell.
     """
     def __init__(self, size: int = 100, win_length: int = None):
         """
@@ -20,13 +55,23 @@ class TicTacToeGame:
             win_length: Number in a row needed to win (defaults to size for small boards, 5 for large boards)
         """
         self.size = size
-        self.win_length = win_length or (size if size <= 5 else 5)
-        self.board = np.zeros((size, size), dtype=int)
+        self.win_length = resolve_win_length(size, win_length)
+        self.board = np.zeros((size, size), dtype=np.int8)
         self.current_player = -1  # Player 1 starts
         self.move_history = []
         self.game_over = False
         self.winner = None
         self.empty_count = size * size
+        self.bb = {-1: 0, 1: 0}  # Per-player bitboards
+        self.occ = 0  # Occupied cells (bb[-1] | bb[1])
+        self._run_plan = self._build_run_plan()
+        # Zobrist keys per (row, col, player); the position hash is kept up to date with one XOR per move
+        self._ztab = zobrist_keys(size)
+        # Display labels depend only on the size, so format them once
+        label_width = 2 if size <= 26 else 3
+        self._display_header = " " + "".join(f"{col:{label_width}} " for col in range(size))
+        self._row_labels = [f"{row:{label_width}} " for row in range(size)]
+        self.zhash = 0
 
     def reset(self):
         """Reset the game to initial state."""
@@ -36,10 +81,18 @@ class TicTacToeGame:
         self.game_over = False
         self.winner = None
         self.empty_count = self.size * self.size
+        self.bb = {-1: 0, 1: 0}
+        self.occ = 0
+        self.zhash = 0
 
     def get_valid_moves(self) -> list:
         """Return list of valid moves as (row, col) tuples."""
-        return list(zip(*np.where(self.board == 0)))
+        rows, cols = np.divmod(self.get_valid_moves_flat(), self.size)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def get_valid_moves_flat(self) -> np.ndarray:
+        """Return valid moves as flat int32 cell indices (row * size + col)."""
+        return np.flatnonzero(self.board.ravel() == 0).astype(np.int32)
 
     def make_move(self, row: int, col: int) -> bool:
         """
@@ -52,88 +105,149 @@ class TicTacToeGame:
         """
         if self.game_over:
             return False
+        # Accept Python and numpy ints, but reject floats rather than truncating them
+        try:
+            row, col = operator.index(row), operator.index(col)
+        except TypeError:
+            return False
         if not (0 <= row < self.size and 0 <= col < self.size):
             return False
-        if self.board[row, col] != 0:
+        bit = 1 << (row * self.size + col)
+        if self.occ & bit:
             return False
 
-        self.board[row, col] = self.current_player
-        self.move_history.append((row, col, self.current_player))
+        player = self.current_player
+        self.board[row, col] = player
+        bb = self.bb[player] | bit
+        self.bb[player] = bb
+        self.occ |= bit
+        self.zhash ^= self._ztab[row][col][0 if player == -1 else 1]
+        self.move_history.append((row, col, player))
         self.empty_count -= 1
 
-        if self._check_win(row, col):
+        # Win check, fused into the move: only rows within win_length - 1 of the move can
+        # hold a new run, so cut that band out of the bitboard and reduce it with the
+        # precomputed shift-and plan
+        n = self.size
+        first = max(0, row - self.win_length + 1)
+        last = min(n, row + self.win_length)
+        band = (bb >> (first * n)) & ((1 << ((last - first) * n)) - 1)
+        won = False
+        for shifts, mask in self._run_plan:
+            m = band
+            for shift in shifts:
+                m &= m >> shift
+            if m & mask:
+                won = True
+                break
+
+        if won:
             self.game_over = True
-            self.winner = self.current_player
+            self.winner = player
         elif self.empty_count == 0:
             self.game_over = True
             self.winner = 0  # Draw
         else:
-            self.current_player = -self.current_player
+            self.current_player = -player
+        return True
+
+    def undo_move(self) -> bool:
+        """
+        Take back the last move.
+        Returns:
+            True if a move was undone, False if there was nothing to undo
+        """
+        if not self.move_history:
+            return False
+
+        row, col, player = self.move_history.pop()
+        bit = 1 << (row * self.size + col)
+        self.board[row, col] = 0
+        self.bb[player] ^= bit
+        self.occ ^= bit
+        self.zhash ^= self._ztab[row][col][0 if player == -1 else 1]
+        self.empty_count += 1
+
+        self.current_player = player
+        self.game_over = False
+        self.winner = None
         return True
 
-    def _check_win(self, row: int, col: int) -> bool:
-        """Check if the last move at (row, col) resulted in a win."""
-        player = self.board[row, col]
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        for dr, dc in directions:
-            if self._check_line(row, col, dr, dc, player):
-                return True
-        return False
+    def get_hash(self) -> int:
+        """Return the Zobrist hash of the current position."""
+        return self.zhash
 
-    def _check_line(self, row: int, col: int, dr: int, dc: int, player: int) -> bool:
+    def _build_run_plan(self) -> list:
         """
-        Check if there's a winning line through (row, col) in direction (dr, dc).
+        Specialize the win check for this board: return (shifts, mask) pairs for the four
+        line directions. Each direction is reduced with the shift-and trick: after
+        m &= m >> (s * step) every set bit marks the start of a run twice as long, so only
+        ~log2(win_length) big-int operations are needed, and the schedule is worked out
+        once up front.
+        Each mask holds the cells a full run may start from without wrapping past the right
+        or left edge of a row; runs leaving the bottom edge shift past the top bit and vanish
+        on their own. Masks cover the 2 * win_length - 1 row band checked by make_move, and
+        directions where no run fits are dropped.
         """
-        count = 1
-        # Positive direction
-        r, c = row + dr, col + dc
-        while 0 <= r < self.size and 0 <= c < self.size and self.board[r, c] == player:
-            count += 1
-            r += dr
-            c += dc
-        # Negative direction
-        r, c = row - dr, col - dc
-        while 0 <= r < self.size and 0 <= c < self.size and self.board[r, c] == player:
-            count += 1
-            r -= dr
-            c -= dc
-        return count >= self.win_length
+        n, w = self.size, self.win_length
+        full_row = (1 << n) - 1
+        left_starts = (1 << max(0, n - w + 1)) - 1  # Columns 0 .. n - w
+        right_starts = full_row & ~((1 << (w - 1)) - 1)  # Columns w - 1 .. n - 1
+
+        def every_row(row_mask: int) -> int:
+            mask = 0
+            for row in range(min(n, 2 * w - 1)):
+                mask |= row_mask << (row * n)
+            return mask
+
+        # Run lengths covered after each step: 1 -> 2 -> 4 -> ... -> w
+        run_steps = []
+        s = 1
+        while s * 2 <= w:
+            run_steps.append(s)
+            s *= 2
+        if s < w:
+            run_steps.append(w - s)
+
+        directions = [
+            (1, every_row(left_starts)),  # Horizontal
+            (n, every_row(full_row)),  # Vertical
+            (n + 1, every_row(left_starts)),  # Diagonal
+            (n - 1, every_row(right_starts)),  # Anti-diagonal
+        ]
+        return [
+            (tuple(k * step for k in run_steps), mask)
+            for step, mask in directions
+            if w <= n and mask
+        ]
 
     def get_board_copy(self) -> np.ndarray:
         """Return a copy of the current board state."""
         return self.board.copy()
 
+    def get_board_readonly(self) -> np.ndarray:
+        """Return a read-only view of the current board state (no copy is made)."""
+        view = self.board.view()
+        view.setflags(write=False)
+        return view
+
     def display(self, clear_screen: bool = True):
         """Display the board in the terminal."""
         if clear_screen:
             clear()
 
         symbols = {-1: 'X', 0: '.', 1: 'O'}
-        latest_move = self.move_history[-1][:2] if self.move_history else None
-
-        # Print column numbers
-        print(" ", end="")
-        for col in range(self.size):
-            if self.size <= 26:
-                print(f"{col:2}", end=" ")
-            else:
-                print(f"{col:3}", end=" ")
-        print()
-
-        # Print board
-        for row in range(self.size):
-            if self.size <= 26:
-                print(f"{row:2} ", end="")
-            else:
-                print(f"{row:3} ", end="")
-            for col in range(self.size):
-                symbol = symbols[self.board[row, col]]
-                if latest_move and (row, col) == latest_move:
-                    print(f" \033[91m{symbol}\033[0m ", end="")
-                else:
-                    print(f" {symbol} ", end="")
-            print()
-        print()
+
+        # Build the whole frame in memory and emit it with a single write
+        cells = np.array([' X ', ' . ', ' O '])[self.board + 1].tolist()
+        if self.move_history:
+            row, col, player = self.move_history[-1]
+            cells[row][col] = f" \033[91m{symbols[player]}\033[0m "
+
+        lines = [self._display_header]
+        lines.extend(label + "".join(row_cells) for label, row_cells in zip(self._row_labels, cells))
+        sys.stdout.write("\n".join(lines) + "\n\n")
+        sys.stdout.flush()
 
     def get_state_info(self) -> dict:
         """Return current game state information."""
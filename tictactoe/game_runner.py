@@ -1,24 +1,84 @@
+import copy
+import random
+import sys
+import threading
+from typing import Callable, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
-from tictactoe.game_engine import TicTacToeGame, clear
+from tictactoe.game_engine import TicTacToeGame, clear, resolve_win_length
 from tictactoe.player_interface import Player
 
+BANNER = '=' * 50
+SYMBOLS = {-1: 'X', 0: '.', 1: 'O'}
+
+# Per-worker state for tournament pools, set up by _init_tournament_worker
+_worker = threading.local()
+
+
+def _gil_disabled() -> bool:
+    """Return True when running on a free-threaded interpreter with the GIL turned off."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _init_tournament_worker(size: int, win_length: int, verbose: bool, players: tuple, player_factories: tuple,
+                            reseed: bool):
+    """
+    Give a pool worker its own runner and its own pair of players.
+    Args:
+        size: Board size
+        win_length: Number in a row needed to win
+        verbose: Whether the worker's runner prints game progress
+        players: (player1, player2) to clone, used when player_factories is None
+        player_factories: Optional (factory1, factory2) of no-argument callables that build
+            fresh players
+        reseed: Whether to reseed the global RNGs; only for process workers, since thread
+            workers share the caller's
+    """
+    if reseed:
+        # Forked process workers inherit the parent's RNG state; reseed so they don't all replay the same games
+        random.seed()
+        np.random.seed()
+    _worker.runner = GameRunner(size=size, win_length=win_length, verbose=verbose)
+    if player_factories is not None:
+        # Building the players here means custom player files are imported in the worker,
+        # so nothing has to be unpickled from a module only the parent has loaded
+        _worker.players = tuple(factory() for factory in player_factories)
+    else:
+        # Thread workers share the parent's objects, so clone the players for each one
+        _worker.players = copy.deepcopy(players)
+
+
+def _play_tournament_game(game_num: int) -> int:
+    """Play one tournament game in a pool worker."""
+    player1, player2 = _worker.players
+    return _worker.runner._play_tournament_game(player1, player2, game_num)
+
 
 class GameRunner:
     """
     Orchestrates matches between players.
     Can run single games or batch tournaments.
+    A runner reuses one TicTacToeGame for all of its games, so it must not be shared
+    between threads; tournament pool workers each build their own runner.
     """
     def __init__(self, size: int = 3, win_length: int = None, verbose: bool = True):
         """
         Initialize the game runner.
         Args:
             size: Board size
-            win_length: Number in a row needed to win
+            win_length: Number in a row needed to win (None for the board's default)
             verbose: Whether to print game progress
         """
         self.size = size
-        self.win_length = win_length
+        self.win_length = resolve_win_length(size, win_length)
         self.verbose = verbose
+        self._game = TicTacToeGame(size=size, win_length=self.win_length)
+        # Game log board labels depend only on the size, so format them once per runner
+        col_width = 2 if size <= 26 else 3
+        self._log_header = " " + "".join(f"{col:{col_width}} " for col in range(size)) + "\n"
+        self._log_labels = [f"{row:{col_width}} " for row in range(size)]
 
     def play_game(self, player1: Player, player2: Player, display_board: bool = False,
                   clear_display: bool = True, save_to: str = None) -> int:
@@ -33,59 +93,72 @@ class GameRunner:
         Returns:
             Winner: -1 (player1), 1 (player2), or 0 (draw)
         """
-        game = TicTacToeGame(size=self.size, win_length=self.win_length)
-        players = {-1: player1, 1: player2}
+        game = self._game
+        game.reset()
+        players = (player1, player2)  # Indexed by (player + 1) >> 1: -1 -> 0, 1 -> 1
 
-        if self.verbose and display_board:
+        # Display is the only optional work inside the move loop; decide it once per game
+        show_board = self.verbose and display_board
+        if show_board:
+            # Built once per game and emitted with a single print before each board
+            title = f"{BANNER}\n{player1.name} (X) vs {player2.name} (O)\n{BANNER}"
             if clear_display:
                 clear()
-            print(f"{'='*50}")
-            print(f"{player1.name} (X) vs {player2.name} (O)")
-            print(f"{'='*50}")
+            print(title)
             game.display(clear_screen=False)
 
+        # Bound once: the loop below runs for every move of every tournament game
+        verbose = self.verbose
+        get_valid_moves = game.get_valid_moves
+        get_board_copy = game.get_board_copy
+        get_board_readonly = game.get_board_readonly
+        make_move = game.make_move
+
         move_count = 0
         while not game.game_over:
-            current_player_obj = players[game.current_player]
-            valid_moves = game.get_valid_moves()
+            current_player_obj = players[(game.current_player + 1) >> 1]
+            valid_moves = get_valid_moves()
             if not valid_moves:
                 break
 
             try:
-                row, col = current_player_obj.get_move(game.get_board_copy(), valid_moves)
-                if not game.make_move(row, col):
-                    if self.verbose:
+                if current_player_obj.needs_board_copy:
+                    board = get_board_copy()
+                else:
+                    board = get_board_readonly()
+                row, col = current_player_obj.get_move(board, valid_moves)
+                if not make_move(row, col):
+                    if verbose:
                         print(f"Invalid move by {current_player_obj.name}: ({row}, {col})")
                     return -game.current_player  # Opponent wins on invalid move
 
                 move_count += 1
-                if self.verbose and display_board:
+                if show_board:
                     if clear_display:
                         clear()
-                    print("\n" * 2)
-                    print(f"{'='*50}")
-                    print(f"{player1.name} (X) vs {player2.name} (O)")
-                    print(f"{'='*50}")
-                    played_symbol = 'X' if game.current_player == 1 else 'O'
-                    print(f"Move {move_count}: {current_player_obj.name} plays ({row}, {col}) as {played_symbol}")
+                    played_symbol = ('O', 'X')[(game.current_player + 1) >> 1]
+                    print(f"\n\n\n{title}\n"
+                          f"Move {move_count}: {current_player_obj.name} plays ({row}, {col}) as {played_symbol}")
                     game.display(clear_screen=False)
 
             except Exception as e:
-                if self.verbose:
+                if verbose:
                     print(f"Error from {current_player_obj.name}: {e}")
                 return -game.current_player  # Opponent wins on error
 
         # Notify players of result
-        player1.game_over(game.winner)
-        player2.game_over(game.winner)
+        if player1.notifies_game_over:
+            player1.game_over(game.winner)
+        if player2.notifies_game_over:
+            player2.game_over(game.winner)
 
-        if self.verbose and display_board:
+        if show_board:
             if game.winner == 0:
                 print("Game ended in a draw!")
             else:
-                winner_name = players[game.winner].name
+                winner_name = players[(game.winner + 1) >> 1].name
                 print(f"{winner_name} wins!")
-            print(f"{'='*50}\n")
+            print(f"{BANNER}\n")
 
         if save_to:
             self._save_game_log(game, player1, player2, save_to)
@@ -94,34 +167,46 @@ class GameRunner:
 
     def _save_game_log(self, game: TicTacToeGame, player1: Player, player2: Player, filepath: str):
         """Save a detailed game log with board states after each move."""
-        symbols = {-1: 'X', 0: '.', 1: 'O'}
-        win_length = self.win_length or game.win_length
 
-        with open(filepath, 'w') as f:
+        with open(filepath, 'w', buffering=1 << 20) as f:
             f.write("Tic-Tac-Toe Game Log\n")
-            f.write(f"{'='*50}\n\n")
+            f.write(f"{BANNER}\n\n")
             f.write("Game Settings:\n")
             f.write(f" Board Size: {self.size}x{self.size}\n")
-            f.write(f" Win Length: {win_length}\n\n")
+            f.write(f" Win Length: {self.win_length}\n\n")
             f.write("Players:\n")
             f.write(f" Player 1 (X): {player1.name}\n")
             f.write(f" Player 2 (O): {player2.name}\n\n")
-            f.write(f"{'='*50}\n\n")
+            f.write(f"{BANNER}\n\n")
+
+            # Board text is kept per row while replaying the moves: each move re-renders only its
+            # own row and the row that held the previous highlight, and every other row is reused
+            header = self._log_header
+            labels = self._log_labels
+            cells = [[f" {SYMBOLS[0]} "] * self.size for _ in range(self.size)]
+            rows = [labels[row] + "".join(cells[row]) + "\n" for row in range(self.size)]
 
             # Initial empty board
             f.write("Initial Board:\n\n")
-            self._write_board(f, np.zeros((self.size, self.size), dtype=int), symbols)
-            f.write(f"\n{'='*50}\n\n")
+            f.write(header + "".join(rows))
+            f.write(f"\n{BANNER}\n\n")
 
             # Board after each move
-            board = np.zeros((self.size, self.size), dtype=int)
+            last_row = None
             for move_num, (row, col, player) in enumerate(game.move_history, 1):
-                board[row, col] = player
                 player_name = player1.name if player == -1 else player2.name
-                symbol = symbols[player]
+                symbol = SYMBOLS[player]
+                cells[row][col] = f" {symbol} "
+                if last_row is not None:
+                    rows[last_row] = labels[last_row] + "".join(cells[last_row]) + "\n"
+                highlighted = cells[row].copy()
+                highlighted[col] = f"*{symbol}*"
+                rows[row] = labels[row] + "".join(highlighted) + "\n"
+                last_row = row
+
                 f.write(f"Move {move_num}: {player_name} ({symbol}) plays at ({row}, {col})\n\n")
-                self._write_board(f, board, symbols, highlight=(row, col))
-                f.write(f"\n{'='*50}\n\n")
+                f.write(header + "".join(rows))
+                f.write(f"\n{BANNER}\n\n")
 
             # Result
             f.write("Result:\n")
@@ -133,66 +218,95 @@ class GameRunner:
                 f.write(f" Winner: {player2.name} (O)\n")
             f.write(f" Total Moves: {len(game.move_history)}\n")
 
-    def _write_board(self, f, board: np.ndarray, symbols: dict, highlight=None):
-        """Write a plain-text board state to file with consistent 3-character cells."""
-        col_width = 2 if self.size <= 26 else 3
-
-        # Column numbers
-        f.write(" ")
-        for col in range(self.size):
-            f.write(f"{col:{col_width}} ")
-        f.write("\n")
-
-        # Rows
-        for row in range(self.size):
-            f.write(f"{row:{col_width}} ")
-            for col in range(self.size):
-                symbol = symbols[board[row, col]]
-                if highlight and (row, col) == highlight:
-                    cell = f"*{symbol}*"
-                else:
-                    cell = f" {symbol} "
-                f.write(cell)
-            f.write("\n")
+    def play_tournament(self, player1: Player, player2: Player, num_games: int, num_workers: int = 1,
+                        on_game_end: Callable[[int], None] = None,
+                        player_factories: Tuple[Callable[[], Player], Callable[[], Player]] = None) -> Optional[dict]:
+        """
+        Play multiple games, alternating who starts first.
+        Args:
+            player1: First player
+            player2: Second player
+            num_games: Number of games to play
+            num_workers: Number of workers. Games are independent, so with more than one worker
+                they are spread over a process pool, or a thread pool on free-threaded Python
+                builds with the GIL disabled. Each worker plays with its own copies of the players
+                (which must be picklable unless player_factories is given), so game_over() is called on
+                those copies and seeded players are no longer reproducible. Tournaments with an
+                interactive player always run in this process.
+            on_game_end: Optional callback, called in game order with each game's winner from
+                player1's point of view (-1 player1, 1 player2, 0 draw) as results come in.
+                Results then go only to the callback: none are kept, so memory use doesn't grow
+                with num_games, and no totals are printed or returned
+            player_factories: Optional (factory1, factory2) of picklable no-argument callables
+                that pool workers call to build their own player1 and player2 instead of copying
+                the instances, e.g. for players whose class can't be imported by name in a worker
+        Returns:
+            Dict with 'player1_wins', 'player2_wins', 'draws' and 'games', or None when
+            on_game_end is given
+        """
+        if self.verbose:
+            print(f"\nStarting tournament: {player1.name} vs {player2.name}\n"
+                  f"Playing {num_games} games on {self.size}x{self.size} board\n"
+                  f"Win length: {self.win_length}\n"
+                  f"{'-' * 50}")
+
+        # A pool only pays off once every worker gets a few games, and pool workers can't read
+        # a human's moves from the terminal
+        interactive = player1.interactive or player2.interactive
+        if num_workers > 1 and num_games >= 2 * num_workers and not interactive:
+            game_winners = self._play_tournament_parallel(player1, player2, num_games, num_workers,
+                                                          player_factories)
+        else:
+            game_winners = (self._play_tournament_game(player1, player2, game_num) for game_num in range(num_games))
 
-    def play_tournament(self, player1: Player, player2: Player, num_games: int) -> dict:
-        """Play multiple games, alternating who starts first."""
+        winners = np.empty(num_games, dtype=np.int8) if on_game_end is None else None
+        progress_interval = max(1, num_games // 10)
+        for game_num, winner in enumerate(game_winners):
+            if winners is None:
+                on_game_end(winner)
+            else:
+                winners[game_num] = winner
+            if self.verbose and (game_num + 1) % progress_interval == 0:
+                print(f"Progress: {game_num + 1}/{num_games} games completed")
+        if winners is None:
+            return None
+
+        # Count player1 wins (-1), draws (0) and player2 wins (1) in one pass
+        player1_wins, draws, player2_wins = np.bincount(winners + 1, minlength=3).tolist()
         results = {
-            'player1_wins': 0,
-            'player2_wins': 0,
-            'draws': 0,
+            'player1_wins': player1_wins,
+            'player2_wins': player2_wins,
+            'draws': draws,
             'games': num_games
         }
 
         if self.verbose:
-            print(f"\nStarting tournament: {player1.name} vs {player2.name}")
-            print(f"Playing {num_games} games on {self.size}x{self.size} board")
-            print(f"Win length: {self.win_length or self.size}")
-            print("-" * 50)
-
-        for game_num in range(num_games):
-            if game_num % 2 == 0:
-                winner = self.play_game(player1, player2, display_board=False)
-            else:
-                winner = self.play_game(player2, player1, display_board=False)
-                if winner != 0:
-                    winner = -winner
-
-            if winner == -1:
-                results['player1_wins'] += 1
-            elif winner == 1:
-                results['player2_wins'] += 1
-            else:
-                results['draws'] += 1
+            print(f"{'-' * 50}\n"
+                  f"\nTournament Results:\n"
+                  f"{player1.name}: {results['player1_wins']} wins ({results['player1_wins']/num_games*100:.1f}%)\n"
+                  f"{player2.name}: {results['player2_wins']} wins ({results['player2_wins']/num_games*100:.1f}%)\n"
+                  f"Draws: {results['draws']} ({results['draws']/num_games*100:.1f}%)")
 
-            if self.verbose and (game_num + 1) % max(1, num_games // 10) == 0:
-                print(f"Progress: {game_num + 1}/{num_games} games completed")
+        return results
 
-        if self.verbose:
-            print("-" * 50)
-            print(f"\nTournament Results:")
-            print(f"{player1.name}: {results['player1_wins']} wins ({results['player1_wins']/num_games*100:.1f}%)")
-            print(f"{player2.name}: {results['player2_wins']} wins ({results['player2_wins']/num_games*100:.1f}%)")
-            print(f"Draws: {results['draws']} ({results['draws']/num_games*100:.1f}%)")
+    def _play_tournament_game(self, player1: Player, player2: Player, game_num: int) -> int:
+        """Play game number game_num of a tournament and return the winner from player1's point of view."""
+        if game_num % 2 == 0:
+            return self.play_game(player1, player2, display_board=False)
+        winner = self.play_game(player2, player1, display_board=False)
+        return -winner
 
-        return results
\ No newline at end of file
+    def _play_tournament_parallel(self, player1: Player, player2: Player, num_games: int, num_workers: int,
+                                  player_factories: tuple = None):
+        """Yield tournament winners (from player1's point of view) in game order, played on a worker pool."""
+        # Without a GIL, threads run games in parallel and skip pickling the players into processes
+        use_threads = _gil_disabled()
+        executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        # Workers that build their own players don't need the instances at all
+        players = (player1, player2) if player_factories is None else None
+        with executor_class(max_workers=num_workers, initializer=_init_tournament_worker,
+                            initargs=(self.size, self.win_length, self.verbose, players, player_factories,
+                                      not use_threads)) as executor:
+            # Hand games out in a few batches per worker so each game doesn't pay its own round trip
+            chunksize = max(1, num_games // (num_workers * 4))
+            yield from executor.map(_play_tournament_game, range(num_games), chunksize=chunksize)
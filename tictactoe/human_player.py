@@ -6,16 +6,24 @@ from tictactoe.player_interface import Player
 class HumanPlayer(Player):
     """Terminal-based human player."""
 
+    needs_board_copy = False
+    notifies_game_over = False
+    interactive = True
+
     def get_move(self, board: np.ndarray, valid_moves: list) -> Tuple[int, int]:
         """
         Prompt the user for a move until a valid (row, col) is provided.
         """
+        # None of this changes between retries, so build it once per call
         valid_move_set = set(valid_moves)
         max_preview = 10
+        prompt = f"{self.name}, enter your move as 'row col': "
+        preview = ", ".join(f"({r}, {c})" for r, c in valid_moves[:max_preview])
+        suffix = "..." if len(valid_moves) > max_preview else ""
 
         while True:
             try:
-                move_input = input(f"{self.name}, enter your move as 'row col': ").strip()
+                move_input = input(prompt).strip()
                 row_str, col_str = move_input.split()
                 row, col = int(row_str), int(col_str)
             except ValueError:
@@ -31,6 +39,4 @@ class HumanPlayer(Player):
 
             print("Invalid move. Please choose one of the valid moves.")
             if valid_moves:
-                preview = ", ".join(f"({r}, {c})" for r, c in valid_moves[:max_preview])
-                suffix = "..." if len(valid_moves) > max_preview else ""
                 print(f"Valid moves: {preview}{suffix}")
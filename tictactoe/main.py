@@ -7,22 +7,29 @@ Supports AI vs AI, Human vs AI, and Human vs Human matches.
 import argparse
 import importlib.util
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 
-from tictactoe.game_runner import GameRunner
-from tictactoe.human_player import HumanPlayer
-from tictactoe.players.random_player import RandomPlayer
-from tictactoe.players.minimax_player import MinimaxPlayer
+# The game modules pull in numpy, so they are imported only once a game is set up;
+# --help and argument errors return without loading them
 
 
-def load_custom_player(filepath: str, player_id: int):
-    """Load custom player from Python file containing Player subclass."""
+@lru_cache(maxsize=32)
+def _load_player_class(filepath: str, mtime_ns: int):
+    """
+    Import a custom player file and return its first Player subclass.
+    Cached per resolved path and modification time, so a file is executed once
+    however many players are built from it, and again only after it changes.
+    """
     path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"Player file not found: {filepath}")
-
     module_name = f"custom_player_{path.stem.replace('.', '_')}"
-    spec = importlib.util.spec_from_file_location(module_name, str(path))
+    # Don't clobber a module loaded from a different file that happens to share the stem
+    suffix = 1
+    while getattr(sys.modules.get(module_name), '__file__', filepath) != filepath:
+        suffix += 1
+        module_name = f"custom_player_{path.stem.replace('.', '_')}_{suffix}"
+
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     spec.loader.exec_module(module)
@@ -36,28 +43,49 @@ def load_custom_player(filepath: str, player_id: int):
     if not player_classes:
         raise ValueError(f"No Player subclass found in {filepath}")
 
-    PlayerClass = player_classes[0]
+    return player_classes[0]
+
+
+def load_custom_player(filepath: str, player_id: int):
+    """Load custom player from Python file containing Player subclass."""
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"Player file not found: {filepath}")
+
+    path = path.resolve()
+    PlayerClass = _load_player_class(str(path), path.stat().st_mtime_ns)
     return PlayerClass(name=path.stem, player_id=player_id)
 
 
-def create_player(player_type: str, player_id: int, player_name: str = None):
-    """Create player instance by type."""
-    type_to_class = {
-        'human': HumanPlayer,
-        'random': RandomPlayer,
-        'minimax': MinimaxPlayer,
-    }
-    lowered = player_type.lower()
-    if lowered in type_to_class:
-        cls = type_to_class[lowered]
-        default_names = {
-            'human': f"Human Player {1 if player_id == -1 else 2}",
-            'random': "Random AI",
-            'minimax': "Minimax AI",
-        }
-        name = player_name or default_names.get(lowered)
-        return cls(name=name, player_id=player_id)
-    return load_custom_player(player_type, player_id)
+def _make_human(player_id: int, name: str = None, win_length: int = None):
+    from tictactoe.human_player import HumanPlayer
+    return HumanPlayer(name=name or f"Human Player {1 if player_id == -1 else 2}", player_id=player_id)
+
+
+def _make_random(player_id: int, name: str = None, win_length: int = None):
+    from tictactoe.players.random_player import RandomPlayer
+    return RandomPlayer(name=name or "Random AI", player_id=player_id)
+
+
+def _make_minimax(player_id: int, name: str = None, win_length: int = None):
+    from tictactoe.players.minimax_player import MinimaxPlayer
+    return MinimaxPlayer(name=name or "Minimax AI", player_id=player_id, win_length=win_length)
+
+
+# Built-in player types, keyed by casefolded name
+_PLAYER_FACTORIES = {
+    'human': _make_human,
+    'random': _make_random,
+    'minimax': _make_minimax,
+}
+
+
+def create_player(player_type: str, player_id: int, player_name: str = None, win_length: int = None):
+    """Create player instance by type. win_length is passed on to built-in players that plan ahead."""
+    factory = _PLAYER_FACTORIES.get(player_type.casefold())
+    if factory is None:
+        return load_custom_player(player_type, player_id)
+    return factory(player_id, player_name, win_length)
 
 
 def main():
@@ -70,6 +98,7 @@ Examples:
   python -m tictactoe.main --player1 human --player2 minimax --size 3 --display
   python -m tictactoe.main --player1 my_ai.py --player2 random --games 100
   python -m tictactoe.main --player1 ai1.py --player2 ai2.py --games 1000 --size 100
+  python -m tictactoe.main --player1 minimax --player2 random --games 1000 --jobs 4
         """
     )
     parser.add_argument('--player1', required=True,
@@ -83,7 +112,7 @@ Examples:
     parser.add_argument('--win-length', type=int, default=None,
                         help='Number in a row to win (default: 5 for boards > 5x5, size otherwise)')
     parser.add_argument('--display', action='store_true',
-                        help='Display board after each move (only for single game)')
+                        help='Display board after each move (only for single game; always on with a human player)')
     parser.add_argument('--no-clear', action='store_true',
                         help="Don't clear terminal when displaying board")
     parser.add_argument('--quiet', action='store_true',
@@ -94,20 +123,29 @@ Examples:
                         help='Custom name for player 2')
     parser.add_argument('--save-to', type=str, default=None,
                         help='Save game log to specified file')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for tournaments (default: 1)')
 
     args = parser.parse_args()
 
+    from tictactoe.game_engine import resolve_win_length
+    from tictactoe.game_runner import GameRunner
+
     try:
-        player1 = create_player(args.player1, -1, args.name1)
-        player2 = create_player(args.player2, 1, args.name2)
+        win_length = resolve_win_length(args.size, args.win_length)
+        player1 = create_player(args.player1, -1, args.name1, win_length)
+        player2 = create_player(args.player2, 1, args.name2, win_length)
 
         verbose = not args.quiet
-        runner = GameRunner(size=args.size, win_length=args.win_length, verbose=verbose)
+        runner = GameRunner(size=args.size, win_length=win_length, verbose=verbose)
 
         if args.games == 1:
+            # Rendering the board every move dominates AI-only games on big boards, so only do
+            # it when asked for, or when an interactive player needs to see the board to play
+            has_interactive = player1.interactive or player2.interactive
             winner = runner.play_game(
                 player1, player2,
-                display_board=args.display or verbose,
+                display_board=args.display or has_interactive,
                 clear_display=not args.no_clear,
                 save_to=args.save_to
             )
@@ -119,11 +157,29 @@ Examples:
                 else:
                     print("\nGame ended in a draw!")
         else:
-            results = runner.play_tournament(player1, player2, args.games)
+            # Pool workers build their own players from the command line rather than unpickling ours
+            player_factories = (partial(create_player, args.player1, -1, args.name1, win_length),
+                                partial(create_player, args.player2, 1, args.name2, win_length))
+            # Quiet mode prints only the totals: the runner hands each result to count_result and
+            # keeps nothing itself
+            player1_wins = player2_wins = draws = 0
+
+            def count_result(winner: int):
+                nonlocal player1_wins, player2_wins, draws
+                if winner == -1:
+                    player1_wins += 1
+                elif winner == 1:
+                    player2_wins += 1
+                else:
+                    draws += 1
+
+            runner.play_tournament(player1, player2, args.games, num_workers=args.jobs,
+                                   on_game_end=None if verbose else count_result,
+                                   player_factories=player_factories)
             if not verbose:
-                print(f"{player1.name}: {results['player1_wins']}")
-                print(f"{player2.name}: {results['player2_wins']}")
-                print(f"Draws: {results['draws']}")
+                print(f"{player1.name}: {player1_wins}")
+                print(f"{player2.name}: {player2_wins}")
+                print(f"Draws: {draws}")
     except KeyboardInterrupt:
         print("\n\nGame interrupted by user.")
         sys.exit(0)
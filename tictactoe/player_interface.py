@@ -7,6 +7,18 @@ import numpy as np
 class Player(ABC):
     """Abstract base class for all players (AI and human)."""
 
+    # Whether get_move needs its own writable copy of the board. Players that only read
+    # the board can set this to False to get a read-only view and skip the per-move copy.
+    needs_board_copy: bool = True
+
+    # Whether the runner should call game_over() at the end of each game. Players that
+    # don't override the hook can set this to False to skip the call.
+    notifies_game_over: bool = True
+
+    # Whether get_move reads from the terminal. Tournament pool workers have no stdin, so
+    # tournaments with an interactive player always run in the calling process.
+    interactive: bool = False
+
     def __init__(self, name: str, player_id: int):
         """
         Initialize player.
@@ -24,7 +36,8 @@ class Player(ABC):
         Get the player's move.
 
         Args:
-            board: Current board state (numpy array with -1, 0, 1).
+            board: Current board state (numpy array with -1, 0, 1); read-only
+                when needs_board_copy is False.
             valid_moves: List of valid moves as (row, col) tuples.
 
         Returns:
@@ -33,7 +46,7 @@ class Player(ABC):
 
     def game_over(self, winner: int) -> None:
         """
-        Optional hook called when the game is over.
+        Optional hook called when the game is over (unless notifies_game_over is False).
 
         Args:
             winner: -1 or 1 if a player won, or 0 for a draw.
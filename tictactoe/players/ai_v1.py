@@ -9,6 +9,9 @@ class Version0(Player):
     AI player that makes random valid moves.
     """
 
+    needs_board_copy = False
+    notifies_game_over = False
+
     def __init__(self, name: str = "Random AI", player_id: int = -1, seed: int = None):
         """
         Initialize random player.
@@ -1,7 +1,14 @@
 import numpy as np
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+from tictactoe.game_engine import resolve_win_length, zobrist_keys
 from tictactoe.player_interface import Player
 
+# Transposition table entry flags: the stored score is exact, a lower bound or an upper bound
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Scores are ints; this bounds them all, including heuristic scores on the largest boards
+SCORE_INF = 10 ** 9
+
 
 class MinimaxPlayer(Player):
     """
@@ -10,7 +17,26 @@ class MinimaxPlayer(Player):
     For large boards, uses depth limit.
     """
 
-    def __init__(self, name: str = "Minimax AI", player_id: int = -1, max_depth: int = None):
+    needs_board_copy = False  # get_move makes its own copy to search on
+    notifies_game_over = False
+
+    # Best moves from full-depth searches, shared by all instances. An unlimited search
+    # depends only on the position, so each one only ever has to be solved once. Only boards
+    # of up to 3x3 are kept: they have a few thousand positions at most, while unlimited
+    # searches on larger boards would grow the dict without bound.
+    _exact_moves: Dict[tuple, Tuple[int, int]] = {}
+
+    # Flat cell indices of every run of win_length cells per (board size, win length), with
+    # the number of row and column runs that lead the array
+    _line_indices_cache: Dict[Tuple[int, int], Tuple[np.ndarray, int]] = {}
+
+    # Winning-line bitmasks per (board size, win length), for boards of up to 64 cells: all of
+    # them, and for each cell the ones through it
+    _line_masks_cache: Dict[Tuple[int, int], list] = {}
+    _cell_masks_cache: Dict[Tuple[int, int], list] = {}
+
+    def __init__(self, name: str = "Minimax AI", player_id: int = -1, max_depth: int = None,
+                 win_length: int = None):
         """
         Initialize minimax player.
 
@@ -18,11 +44,24 @@ class MinimaxPlayer(Player):
             name: Player's name
             player_id: Player identifier (-1 or 1)
             max_depth: Maximum search depth (None for unlimited, recommended for large boards)
+            win_length: Number in a row needed to win (None for the board's default)
         """
         super().__init__(name, player_id)
         self.max_depth = max_depth
+        self.game_win_length = win_length
         self.board_size = None
         self.win_length = None
+        self._tt = {}  # Zobrist hash -> (remaining depth, flag, score, best move), rebuilt for every move
+        self._hash = 0
+        self._bb = [0, 0]  # Bitboards for players -1 and 1: bit (row * size + col) per stone
+        self._lines = None  # (num_lines, win_length) flat cell indices: rows, columns, diagonals
+        self._straight_lines = 0  # Number of row and column lines at the start of _lines
+        self._line_masks = None
+        self._cell_masks = None
+        self._full_depth = 0  # Search depth at which the board is full
+        self._empties = []  # Empty cells, strongest first, kept up to date by the search
+        self._killers = []  # Per depth, up to two recent moves that caused a cutoff there
+        self._board = None  # int8 search board, reused across moves
 
     def get_move(self, board: np.ndarray, valid_moves: list) -> Tuple[int, int]:
         """
@@ -38,9 +77,16 @@ class MinimaxPlayer(Player):
         if not valid_moves:
             raise ValueError("No valid moves available")
 
+        # The search plays moves on the board in place, so work on a private int8 copy, kept
+        # between calls so each move refills the same buffer
+        if self._board is None or self._board.shape != board.shape:
+            self._board = np.empty(board.shape, dtype=np.int8)
+        np.copyto(self._board, board, casting='unsafe')
+        board = self._board
+
         # Initialize board parameters
         self.board_size = board.shape[0]
-        self.win_length = min(5, self.board_size)  # Assume standard win length
+        self.win_length = resolve_win_length(self.board_size, self.game_win_length)
 
         # If no depth limit set, use heuristic based on board size
         if self.max_depth is None:
@@ -53,28 +99,96 @@ class MinimaxPlayer(Player):
         else:
             depth_limit = self.max_depth
 
-        best_score = -float('inf')
-        best_move = valid_moves[0]
-
-        for move in valid_moves:
-            row, col = move
-            # Make move
-            board[row, col] = self.player_id
-
-            # Evaluate position
-            score = self._minimax(board, 0, False, -float('inf'), float('inf'), depth_limit)
-
-            # Undo move
-            board[row, col] = 0
+        exact = depth_limit == float('inf')
+        remember = exact and self.board_size <= 3
+        if remember:
+            cache_key = (self.board_size, self.win_length, board.tobytes(), self.player_id, tuple(valid_moves))
+            cached_move = self._exact_moves.get(cache_key)
+            if cached_move is not None:
+                return cached_move
+
+        # Hash the position and fill the bitboards once; the search then updates both with
+        # one XOR per move and undo
+        n = self.board_size
+        keys = self._zobrist_table(n)
+        self._hash = 0
+        self._bb = [0, 0]
+        for row, col in np.argwhere(board != 0).tolist():
+            side = 0 if board[row, col] == -1 else 1
+            self._hash ^= keys[row][col][side]
+            self._bb[side] |= 1 << (row * n + col)
+        self._lines, self._straight_lines = self._line_indices(n, self.win_length)
+        if n * n <= 64:
+            self._line_masks = self._winning_lines(n, self.win_length)
+            self._cell_masks = self._winning_lines_by_cell(n, self.win_length)
+        else:
+            self._line_masks = self._cell_masks = None
+
+        # The search only checks the lines through each new stone, so rule out a win that is
+        # already on the board here. Every move scores the same in a finished position.
+        if self._check_winner(board) is not None:
+            return valid_moves[0]
+        # Children are searched in _empties order, so put the strongest cells first: those on the
+        # most winning lines, then those nearest the centre. Good moves early mean more cutoffs.
+        rows, cols = np.where(board == 0)
+        lines_through = np.bincount(self._lines.ravel(), minlength=n * n)[rows * n + cols]
+        center = (n - 1) / 2
+        distance = (rows - center) ** 2 + (cols - center) ** 2
+        by_strength = np.lexsort((distance, -lines_through))
+        self._empties = list(zip(rows[by_strength].tolist(), cols[by_strength].tolist()))
+        self._full_depth = len(self._empties) - 1
+
+        self._tt = {}
+        self._killers = [[] for _ in range(len(valid_moves) + 1)]
+        own_key = 0 if self.player_id == -1 else 1
+
+        # Iterative deepening: each pass searches the root moves best-first by the previous
+        # pass's scores, and leaves best-move hints and killer moves that order the next one.
+        # Searching past the number of empty cells changes nothing, so that caps the last pass.
+        # An unlimited search goes straight to its last pass; on the small boards it is used for,
+        # the shallow passes cost more than their move ordering saves.
+        final_depth = min(depth_limit, len(valid_moves) - 1)
+        first_depth = final_depth if exact else min(1, final_depth)
+        # The first pass searches the root moves in the same order
+        rank = {move: i for i, move in enumerate(self._empties)}
+        order = sorted(range(len(valid_moves)), key=lambda index: rank[tuple(valid_moves[index])])
+        for max_depth in range(first_depth, final_depth + 1):
+            best_score = -SCORE_INF
+            best_index = 0
+            scores = {}
+            for index in order:
+                row, col = int(valid_moves[index][0]), int(valid_moves[index][1])
+                # Make move
+                board[row, col] = self.player_id
+                self._hash ^= keys[row][col][own_key]
+                self._bb[own_key] ^= 1 << (row * n + col)
+                empty_index = self._empties.index((row, col))
+                del self._empties[empty_index]
 
-            if score > best_score:
-                best_score = score
-                best_move = move
+                # Evaluate position. Scores are whole numbers, so searching just below the best
+                # score so far still yields exact scores for every move that ties it.
+                score = self._minimax(board, 0, False, best_score - 1, SCORE_INF, max_depth, (row, col))
 
+                # Undo move
+                board[row, col] = 0
+                self._hash ^= keys[row][col][own_key]
+                self._bb[own_key] ^= 1 << (row * n + col)
+                self._empties.insert(empty_index, (row, col))
+
+                scores[index] = score
+                # Ties go to the earliest valid move, whatever order the moves were searched in
+                if score > best_score or (score == best_score and index < best_index):
+                    best_score = score
+                    best_index = index
+            order.sort(key=lambda index: -scores[index])
+        best_move = valid_moves[best_index]
+
+        if remember:
+            self._exact_moves[cache_key] = best_move
         return best_move
 
     def _minimax(self, board: np.ndarray, depth: int, is_maximizing: bool,
-                 alpha: float, beta: float, max_depth: int) -> float:
+                 alpha: int, beta: int, max_depth: int, last_move: Tuple[int, int]) -> int:
         """
         Minimax algorithm with alpha-beta pruning.
 
@@ -85,50 +199,190 @@ class MinimaxPlayer(Player):
             alpha: Alpha value for pruning
             beta: Beta value for pruning
             max_depth: Maximum search depth
+            last_move: The move that led to this position
 
         Returns:
             Score of the position
         """
-        # Check terminal conditions
-        winner = self._check_winner(board)
-        if winner is not None:
-            if winner == self.player_id:
-                return 1000 - depth  # Prefer faster wins
-            elif winner == -self.player_id:
-                return -1000 + depth  # Prefer slower losses
+        # A position reached again through another move order is always at the same depth, so
+        # its stored score can be reused. Entries from a different remaining depth are not, so
+        # the result stays exactly that of the plain fixed-depth search.
+        remaining = max_depth - depth
+        entry = self._tt.get(self._hash)
+        hint = None
+        if entry is not None:
+            # The best move found here is worth trying first whatever depth it came from
+            hint = entry[3]
+            if entry[0] == remaining:
+                _, flag, score, _ = entry
+                if flag == EXACT:
+                    return score
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if beta <= alpha:
+                    return score
+
+        score, best_move = self._search(board, depth, is_maximizing, alpha, beta, max_depth, last_move, hint)
+
+        # Fail-soft alpha-beta: a score outside the (alpha, beta) window is only a bound
+        if score <= alpha:
+            flag = UPPER
+        elif score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._tt[self._hash] = (remaining, flag, score, best_move)
+        return score
+
+    def _search(self, board: np.ndarray, depth: int, is_maximizing: bool, alpha: int, beta: int,
+                max_depth: int, last_move: Tuple[int, int], hint: Optional[Tuple[int, int]]):
+        """
+        Search one node for _minimax, which handles the transposition table around it.
+
+        Returns:
+            (score, best move), where the move is None at leaves
+        """
+        # Check terminal conditions. The position before last_move was still open, so only a
+        # line through that stone can have been completed.
+        row, col = last_move
+        if self._wins_at(board, row, col):
+            if board[row, col] == self.player_id:
+                return 1000 - depth, None  # Prefer faster wins
             else:
-                return 0  # Draw
+                return -1000 + depth, None  # Prefer slower losses
+        if depth == self._full_depth:
+            return 0, None  # Draw
 
         # Check depth limit
         if depth >= max_depth:
-            return self._evaluate_position(board)
+            return self._evaluate_position(board), None
 
-        valid_moves = list(zip(*np.where(board == 0)))
+        # Children come from the maintained list of empty cells rather than a board scan
+        empties = self._empties
+        valid_moves = empties.copy()
         if not valid_moves:
-            return 0  # Draw
-
+            return 0, None  # Draw
+
+        # Try the stored best move first, then this depth's killer moves
+        killers = self._killers[depth]
+        first = []
+        for move in (hint, *killers):
+            if move is not None and move not in first and board[move] == 0:
+                first.append(move)
+        if first:
+            valid_moves = first + [move for move in valid_moves if move not in first]
+
+        n = self.board_size
+        keys = self._zobrist_table(n)
+        bb = self._bb
+        best_move = None
         if is_maximizing:
-            max_eval = -float('inf')
-            for row, col in valid_moves:
+            key = 0 if self.player_id == -1 else 1
+            max_eval = -SCORE_INF
+            for move in valid_moves:
+                row, col = move
                 board[row, col] = self.player_id
-                eval = self._minimax(board, depth + 1, False, alpha, beta, max_depth)
+                self._hash ^= keys[row][col][key]
+                bb[key] ^= 1 << (row * n + col)
+                empty_index = empties.index(move)
+                del empties[empty_index]
+                eval = self._minimax(board, depth + 1, False, alpha, beta, max_depth, move)
                 board[row, col] = 0
-                max_eval = max(max_eval, eval)
+                self._hash ^= keys[row][col][key]
+                bb[key] ^= 1 << (row * n + col)
+                empties.insert(empty_index, move)
+                if eval > max_eval:
+                    max_eval = eval
+                    best_move = move
                 alpha = max(alpha, eval)
                 if beta <= alpha:
+                    self._add_killer(killers, move)
                     break
-            return max_eval
+            return max_eval, best_move
         else:
-            min_eval = float('inf')
-            for row, col in valid_moves:
+            key = 1 if self.player_id == -1 else 0
+            min_eval = SCORE_INF
+            for move in valid_moves:
+                row, col = move
                 board[row, col] = -self.player_id
-                eval = self._minimax(board, depth + 1, True, alpha, beta, max_depth)
+                self._hash ^= keys[row][col][key]
+                bb[key] ^= 1 << (row * n + col)
+                empty_index = empties.index(move)
+                del empties[empty_index]
+                eval = self._minimax(board, depth + 1, True, alpha, beta, max_depth, move)
                 board[row, col] = 0
-                min_eval = min(min_eval, eval)
+                self._hash ^= keys[row][col][key]
+                bb[key] ^= 1 << (row * n + col)
+                empties.insert(empty_index, move)
+                if eval < min_eval:
+                    min_eval = eval
+                    best_move = move
                 beta = min(beta, eval)
                 if beta <= alpha:
+                    self._add_killer(killers, move)
                     break
-            return min_eval
+            return min_eval, best_move
+
+    @staticmethod
+    def _add_killer(killers: list, move: Tuple[int, int]):
+        """Remember a move that caused a cutoff, keeping the two most recent per depth."""
+        if not killers or killers[0] != move:
+            killers.insert(0, move)
+            del killers[2:]
+
+    @classmethod
+    def _line_indices(cls, size: int, win_length: int) -> Tuple[np.ndarray, int]:
+        """
+        Return the flat cell indices (row * size + col) of every run of win_length cells on a
+        size x size board, one run per row of an int32 array: rows, then columns, then both
+        diagonal directions. Also returns how many row and column runs lead the array.
+        """
+        key = (size, win_length)
+        cached = cls._line_indices_cache.get(key)
+        if cached is None:
+            cells = np.arange(size * size, dtype=np.int32).reshape(size, size)
+            starts = max(0, size - win_length + 1)  # Start positions of a run along a line
+            run = np.arange(starts)[:, None] + np.arange(win_length)
+            rows = run[:, None, :]  # Diagonal runs start at (row, col) for every pair of starts
+            cols = run[None, :, :]
+            lines = np.concatenate((
+                cells[:, run].reshape(-1, win_length),  # Rows
+                cells.T[:, run].reshape(-1, win_length),  # Columns
+                cells[rows, cols].reshape(-1, win_length),  # Diagonals
+                cells[rows, cols[..., ::-1]].reshape(-1, win_length),  # Anti-diagonals
+            ))
+            cached = (lines, 2 * size * starts)
+            cls._line_indices_cache[key] = cached
+        return cached
+
+    @classmethod
+    def _winning_lines(cls, size: int, win_length: int) -> list:
+        """Return a bitmask for every run of win_length cells on a size x size board."""
+        key = (size, win_length)
+        masks = cls._line_masks_cache.get(key)
+        if masks is None:
+            lines, _ = cls._line_indices(size, win_length)
+            masks = [sum(1 << index for index in line) for line in lines.tolist()]
+            cls._line_masks_cache[key] = masks
+        return masks
+
+    @classmethod
+    def _winning_lines_by_cell(cls, size: int, win_length: int) -> list:
+        """Return, for each cell index (row * size + col), the winning-line bitmasks through it."""
+        key = (size, win_length)
+        cell_masks = cls._cell_masks_cache.get(key)
+        if cell_masks is None:
+            masks = cls._winning_lines(size, win_length)
+            cell_masks = [[mask for mask in masks if mask >> index & 1] for index in range(size * size)]
+            cls._cell_masks_cache[key] = cell_masks
+        return cell_masks
+
+    @staticmethod
+    def _zobrist_table(size: int) -> list:
+        """Return the Zobrist keys for a size x size board, shared with the game engine."""
+        return zobrist_keys(size)
 
     def _check_winner(self, board: np.ndarray) -> Optional[int]:
         """
@@ -150,78 +404,71 @@ class MinimaxPlayer(Player):
 
     def _has_won(self, board: np.ndarray, player: int) -> bool:
         """Check if a player has won."""
-        # For efficiency on large boards, only check recent high-value positions
-        # This is a simplified check - full check would be more expensive
-
-        # Check rows
-        for i in range(self.board_size):
-            for j in range(self.board_size - self.win_length + 1):
-                if np.all(board[i, j:j + self.win_length] == player):
-                    return True
-
-        # Check columns
-        for i in range(self.board_size - self.win_length + 1):
-            for j in range(self.board_size):
-                if np.all(board[i:i + self.win_length, j] == player):
-                    return True
-
-        # Check diagonals (main direction)
-        for i in range(self.board_size - self.win_length + 1):
-            for j in range(self.board_size - self.win_length + 1):
-                if all(board[i + k, j + k] == player for k in range(self.win_length)):
+        masks = self._line_masks
+        if masks is not None:
+            # Small boards: test the player's bitboard against every winning line
+            stones = self._bb[0 if player == -1 else 1]
+            for mask in masks:
+                if (stones & mask) == mask:
                     return True
-
-        # Check diagonals (anti direction)
-        for i in range(self.board_size - self.win_length + 1):
-            for j in range(self.win_length - 1, self.board_size):
-                if all(board[i + k, j - k] == player for k in range(self.win_length)):
+            return False
+
+        # Larger boards: test every line at once on the precomputed cell indices
+        return bool((board.ravel()[self._lines] == player).all(axis=1).any())
+
+    def _wins_at(self, board: np.ndarray, row: int, col: int) -> bool:
+        """Check whether the stone at (row, col) is part of a winning line."""
+        cell_masks = self._cell_masks
+        n = self.board_size
+        if cell_masks is not None:
+            stones = self._bb[0 if board[row, col] == -1 else 1]
+            for mask in cell_masks[row * n + col]:
+                if (stones & mask) == mask:
                     return True
-
+            return False
+
+        # Larger boards: count the run through the stone both ways along each direction
+        player = board[row, col]
+        w = self.win_length
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            run = 1
+            r, c = row + dr, col + dc
+            while run < w and 0 <= r < n and 0 <= c < n and board[r, c] == player:
+                run += 1
+                r += dr
+                c += dc
+            r, c = row - dr, col - dc
+            while run < w and 0 <= r < n and 0 <= c < n and board[r, c] == player:
+                run += 1
+                r -= dr
+                c -= dc
+            if run >= w:
+                return True
         return False
 
-    def _evaluate_position(self, board: np.ndarray) -> float:
+    def _evaluate_position(self, board: np.ndarray) -> int:
         """
         Evaluate the board position heuristically.
 
         Returns:
             Score from perspective of self.player_id
         """
-        score = 0
+        # Every row and column window of win_length cells, one per line of the array
+        windows = board.ravel()[self._lines[:self._straight_lines]]
+        own_counts = np.count_nonzero(windows == self.player_id, axis=1)
+        opponent_counts = np.count_nonzero(windows == -self.player_id, axis=1)
 
         # Count threats and opportunities
-        for player in [self.player_id, -self.player_id]:
-            multiplier = 1 if player == self.player_id else -1
-
-            # Evaluate rows
-            for i in range(self.board_size):
-                for j in range(self.board_size - self.win_length + 1):
-                    window = board[i, j:j + self.win_length]
-                    score += multiplier * self._evaluate_window(window, player)
-
-            # Evaluate columns
-            for i in range(self.board_size - self.win_length + 1):
-                for j in range(self.board_size):
-                    window = board[i:i + self.win_length, j]
-                    score += multiplier * self._evaluate_window(window, player)
-
-        return score
-
-    def _evaluate_window(self, window: np.ndarray, player: int) -> float:
-        """Evaluate a window of cells."""
-        player_count = np.sum(window == player)
-        empty_count = np.sum(window == 0)
-        opponent_count = np.sum(window == -player)
-
-        # If opponent has pieces, this window is blocked
-        if opponent_count > 0:
-            return 0
-
-        # Score based on how many pieces we have
-        if player_count == self.win_length - 1 and empty_count == 1:
-            return 10  # One move from winning
-        elif player_count == self.win_length - 2 and empty_count == 2:
-            return 5  # Two moves from winning
-        elif player_count > 0:
-            return player_count
-
-        return 0
+        return int(self._score_windows(own_counts, opponent_counts)
+                   - self._score_windows(opponent_counts, own_counts))
+
+    def _score_windows(self, player_counts: np.ndarray, opponent_counts: np.ndarray) -> int:
+        """Sum the window scores for a player, given its and the opponent's stones per window."""
+        w = self.win_length
+        empty_counts = w - player_counts - opponent_counts
+        scores = np.where(
+            (player_counts == w - 1) & (empty_counts == 1), 10,  # One move from winning
+            np.where((player_counts == w - 2) & (empty_counts == 2), 5,  # Two moves from winning
+                     player_counts))
+        # If opponent has pieces, the window is blocked
+        return scores[opponent_counts == 0].sum()